@@ -12,14 +12,20 @@ Example
 ...     run_workload()
 ...     nv.sync()
 >>> data = read_trace("trace.bin")
->>> data["gpu_load"]       # numpy array, 0–1000
+>>> data.gpu_load          # numpy array, 0–1000 (or data["gpu_load"])
 """
 
 from __future__ import annotations
 
+import functools
+import math
+import mmap
+import os
 import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
 
 import numpy as np
 import numpy.typing as npt
@@ -40,16 +46,15 @@ __all__ = [
     "get_board_config",
     "TraceData",
     "read_trace",
+    "read_traces",
+    "sync_id_at",
 ]
 
 # ── Binary format constants ─────────────────────────────────────────
 
 _MAGIC = 0x4E564D54
-_VERSION = 1
+_SUPPORTED_VERSIONS = (1, 2)
 _HEADER_SIZE = 728
-_MAX_CPU_CORES = 16
-_MAX_POWER_RAILS = 8
-_MAX_THERMAL_ZONES = 16
 
 # Struct sizes (must match C++ packed structs)
 _FAST_SAMPLE_SIZE = 98
@@ -57,9 +62,73 @@ _MEDIUM_SAMPLE_SIZE = 104
 _SLOW_SAMPLE_SIZE = 72
 _SYNC_POINT_SIZE = 16
 
-
-class TraceData(TypedDict):
-    """Parsed trace file contents."""
+# Version 2 columns are zero-padded to this many bytes (COLUMN_ALIGN)
+_COLUMN_ALIGN = 8
+
+# Copy columns on a thread pool once a trace holds this many sample bytes
+_PARALLEL_COPY_BYTES = 1 << 20
+
+# Maximum number of trace files read_traces keeps in flight
+_MAX_INFLIGHT_READS = 64
+
+# Alignment (bytes) of copied output arrays, for SIMD consumers. Only
+# columns of at least _ALIGN_MIN_BYTES are aligned; below that the
+# over-allocation costs more than aligned access saves.
+_OUTPUT_ALIGN = 64
+_ALIGN_MIN_BYTES = 4096
+
+# Pre-compiled header field parsers
+_HDR_MAGIC = struct.Struct("<II")    # magic, version
+_HDR_COUNTS = struct.Struct("<BBBB")  # cpu cores, rails, zones, emc flag
+_HDR_HZ = struct.Struct("<III")      # fast/medium/slow Hz
+_HDR_NS = struct.Struct("<QQQQ")     # fast/medium/slow/sync counts
+
+# Per-tier field layouts: (TraceData key, byte offset within the version 1
+# record, dtype, header count that array fields are trimmed to — None for
+# scalars). Version 2 files store the same fields as columns, in order.
+_FAST_FIELDS = (
+    ("fast_time_s", 0, "<f8", None),
+    ("gpu_load", 8, "<u2", None),
+    ("cpu_util", 10, "<f4", "num_cpu_cores"),
+    ("cpu_aggregate", 74, "<f4", None),
+    ("ram_used_kb", 78, "<u8", None),
+    ("ram_available_kb", 86, "<u8", None),
+    ("emc_util", 94, "<f4", None),
+)
+_MEDIUM_FIELDS = (
+    ("medium_time_s", 0, "<f8", None),
+    ("voltage_mv", 8, "<u4", "num_power_rails"),
+    ("current_ma", 40, "<u4", "num_power_rails"),
+    ("power_mw", 72, "<f4", "num_power_rails"),
+)
+_SLOW_FIELDS = (
+    ("slow_time_s", 0, "<f8", None),
+    ("temp_c", 8, "<f4", "num_thermal_zones"),
+)
+# (fields, version 1 record size) per tier, in file order
+_TIERS = (
+    (_FAST_FIELDS, _FAST_SAMPLE_SIZE),
+    (_MEDIUM_FIELDS, _MEDIUM_SAMPLE_SIZE),
+    (_SLOW_FIELDS, _SLOW_SAMPLE_SIZE),
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TraceData:
+    """Parsed trace file contents.
+
+    Fields are plain attributes (``data.gpu_load``). For code written
+    against the earlier dict-based API, the read-only mapping interface is
+    also supported: ``data["gpu_load"]``, ``"gpu_load" in data``,
+    ``len(data)``, ``data.get(...)``, ``keys()``, ``values()``,
+    ``items()`` and iteration over the keys (so ``dict(data)`` works).
+
+    ``sync_id`` is built from the sync points the first time it is read
+    and cached, so callers that never use it never allocate it. Because it
+    is a property, ``dataclasses.asdict`` and ``dataclasses.fields`` do
+    not list it (they show the private cache instead); use ``dict(data)``
+    to convert a trace to a dict.
+    """
 
     # Header metadata
     board_name: str
@@ -93,104 +162,426 @@ class TraceData(TypedDict):
     temp_c: npt.NDArray[np.float32]         # shape (N, num_thermal_zones)
 
     # Sync points
-    sync_id: npt.NDArray[np.uint64]         # per fast sample (forward-filled)
+    sync_points_idx: npt.NDArray[np.uint64]  # fast-sample index, ascending
+    sync_points_id: npt.NDArray[np.uint64]   # id of each sync point
+    _sync_id: npt.NDArray[np.uint64] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    @property
+    def sync_id(self) -> npt.NDArray[np.uint64]:
+        """Per-fast-sample sync id (forward-filled), built on first access."""
+        sync_id = self._sync_id
+        if sync_id is None:
+            sync_id = _forward_fill_sync(
+                self.sync_points_idx,
+                self.sync_points_id,
+                len(self.fast_time_s),
+            )
+            object.__setattr__(self, "_sync_id", sync_id)
+        return sync_id
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _TRACE_KEY_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _TRACE_KEY_SET
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_TRACE_KEYS)
+
+    def __len__(self) -> int:
+        return len(_TRACE_KEYS)
+
+    def keys(self) -> tuple[str, ...]:
+        return _TRACE_KEYS
+
+    def values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, key) for key in _TRACE_KEYS)
+
+    def items(self) -> tuple[tuple[str, Any], ...]:
+        return tuple((key, getattr(self, key)) for key in _TRACE_KEYS)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in _TRACE_KEY_SET else default
+
+
+# Keys of the dict-style interface, in the order of the old TypedDict
+_TRACE_KEYS = tuple(
+    name for name in TraceData.__dataclass_fields__
+    if not name.startswith("_")
+) + ("sync_id",)
+_TRACE_KEY_SET = frozenset(_TRACE_KEYS)
+
+
+class _Column(NamedTuple):
+    """Where one output array lives in the file."""
+
+    key: str
+    offset: int
+    dtype: str
+    shape: tuple[int, ...]
+    strides: tuple[int, ...]
+
+
+# Locates every column of one file given its (fast, medium, slow) sample
+# counts; returns the columns and the byte offset of the sync point table.
+_Locator = Callable[[tuple[int, int, int]], tuple[list[_Column], int]]
+
+
+@functools.lru_cache(maxsize=8)
+def _make_locator(
+    version: int, num_cpu: int, num_rails: int, num_zones: int
+) -> _Locator:
+    """Build the column locator for one format version and board shape.
+
+    Everything that depends only on the board's core/rail/zone counts
+    (dtypes, trimmed widths, strides, per-sample column sizes) is
+    resolved once here and cached, so a fleet of traces from the same few
+    boards only pays for it once. The returned function just places each
+    column for a file's sample counts.
+    """
+    widths = {
+        "num_cpu_cores": num_cpu,
+        "num_power_rails": num_rails,
+        "num_thermal_zones": num_zones,
+    }
+    # Per tier: (record size, [(key, field offset, dtype, row shape,
+    # row strides, bytes per sample)])
+    tiers = []
+    for fields, size in _TIERS:
+        plan = []
+        for key, field_off, dtype, width_key in fields:
+            itemsize = np.dtype(dtype).itemsize
+            if width_key is None:
+                row_shape: tuple[int, ...] = ()
+                row_strides: tuple[int, ...] = ()
+                row_bytes = itemsize
+            else:
+                row_shape = (widths[width_key],)
+                row_strides = (itemsize,)
+                row_bytes = widths[width_key] * itemsize
+            plan.append(
+                (key, field_off, dtype, row_shape, row_strides, row_bytes)
+            )
+        tiers.append((size, plan))
+
+    def locate_records(
+        counts: tuple[int, int, int]
+    ) -> tuple[list[_Column], int]:
+        # Version 1: packed records, one strided view per field
+        layout = []
+        offset = _HEADER_SIZE
+        for (size, plan), count in zip(tiers, counts):
+            for key, field_off, dtype, row_shape, row_strides, _ in plan:
+                layout.append(_Column(
+                    key, offset + field_off, dtype,
+                    (count, *row_shape), (size, *row_strides),
+                ))
+            offset += count * size
+        return layout, offset
+
+    def locate_columns(
+        counts: tuple[int, int, int]
+    ) -> tuple[list[_Column], int]:
+        # Version 2: contiguous columns, each padded to _COLUMN_ALIGN
+        layout = []
+        offset = _HEADER_SIZE
+        for (_, plan), count in zip(tiers, counts):
+            for key, _, dtype, row_shape, row_strides, row_bytes in plan:
+                layout.append(_Column(
+                    key, offset, dtype,
+                    (count, *row_shape), (row_bytes, *row_strides),
+                ))
+                nbytes = count * row_bytes
+                offset += -(-nbytes // _COLUMN_ALIGN) * _COLUMN_ALIGN
+        return layout, offset
+
+    return locate_records if version == 1 else locate_columns
+
+
+def _aligned_empty(shape: tuple[int, ...], dtype: str) -> np.ndarray:
+    """``np.empty`` whose data pointer is aligned to ``_OUTPUT_ALIGN``.
+
+    NumPy's default allocator only guarantees 16-byte alignment; this
+    over-allocates a byte buffer and returns an aligned view into it.
+    """
+    nbytes = math.prod(shape) * np.dtype(dtype).itemsize
+    raw = np.empty(nbytes + _OUTPUT_ALIGN, dtype=np.uint8)
+    start = -raw.ctypes.data % _OUTPUT_ALIGN
+    return raw[start : start + nbytes].view(dtype).reshape(shape)
+
+
+def _column(
+    data: bytes | mmap.mmap, col: _Column, copy: bool = True
+) -> np.ndarray:
+    """Copy one column out of ``data`` into a contiguous array.
+
+    The column is read in place through an ``offset``/``strides`` view,
+    so only its own bytes (and only the active elements of array fields)
+    are touched. With ``copy=False`` that view is returned as-is; it keeps
+    ``data`` alive for as long as it is referenced, and empty columns are
+    made read-only to match. Copies of at least ``_ALIGN_MIN_BYTES`` are
+    aligned to ``_OUTPUT_ALIGN``.
+    """
+    if col.shape[0] == 0:
+        out = np.empty(col.shape, dtype=col.dtype)
+        out.flags.writeable = copy
+        return out
+    view = np.ndarray(
+        col.shape,
+        dtype=col.dtype,
+        buffer=data,
+        offset=col.offset,
+        strides=col.strides,
+    )
+    if not copy:
+        return view
+    if view.nbytes < _ALIGN_MIN_BYTES:
+        return view.copy()
+    out = _aligned_empty(col.shape, col.dtype)
+    np.copyto(out, view)
+    return out
+
+
+def _copy_workers() -> int:
+    """Number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on every platform
+        return os.cpu_count() or 1
+
+
+def _copy_columns(
+    data: bytes | mmap.mmap, layout: list[_Column], parallel: bool = True
+) -> dict[str, np.ndarray]:
+    """Copy every column in ``layout`` out of ``data``.
+
+    Columns cover disjoint byte ranges and NumPy releases the GIL while
+    copying, so large traces are copied on a thread pool to use more than
+    one memory channel. Small traces are copied inline, where thread
+    startup would dominate, as is everything when ``parallel`` is False.
+    """
+    if not parallel:
+        return {col.key: _column(data, col) for col in layout}
+    total = sum(
+        math.prod(col.shape) * np.dtype(col.dtype).itemsize for col in layout
+    )
+    workers = min(_copy_workers(), len(layout))
+    if total <= _PARALLEL_COPY_BYTES or workers < 2:
+        return {col.key: _column(data, col) for col in layout}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        arrays = pool.map(lambda col: _column(data, col), layout)
+        return {col.key: arr for col, arr in zip(layout, arrays)}
+
+
+def _forward_fill_sync(
+    sync_idx: npt.NDArray[np.uint64],
+    sync_ids: npt.NDArray[np.uint64],
+    n_fast: int,
+) -> npt.NDArray[np.uint64]:
+    """Expand sorted sync points into a per-fast-sample ``sync_id`` array.
+
+    Each fast sample takes the id of the last sync point at or before it
+    (0 if none). The output is built by repeating each id over its run of
+    samples, so every element is written exactly once and no
+    ``n_fast``-sized temporaries are needed.
+    """
+    if len(sync_idx) == 0:
+        return np.zeros(n_fast, dtype=np.uint64)
+    bounds = np.concatenate(
+        ([0], np.minimum(sync_idx, n_fast).astype(np.int64), [n_fast])
+    )
+    ids = np.concatenate((np.zeros(1, dtype=np.uint64), sync_ids))
+    return np.repeat(ids, np.diff(bounds))
+
+
+def _advise_full_read(mm: mmap.mmap) -> None:
+    """Tell the kernel the whole mapping is about to be read in order.
+
+    ``MADV_SEQUENTIAL`` enables aggressive read-ahead and
+    ``MADV_WILLNEED`` starts reading the entire file into the page cache
+    now, so the column copies that follow mostly hit resident pages
+    instead of faulting on each read-ahead window. Advice flags missing
+    on this platform are skipped.
+    """
+    for name in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+        advice = getattr(mmap, name, None)
+        if advice is not None:
+            mm.madvise(advice)
 
 
-def read_trace(path: str | Path) -> TraceData:
+def read_trace(path: str | Path, copy: bool = True) -> TraceData:
     """Read a fastnvmetrics binary trace file.
 
+    The file is memory-mapped rather than read into a Python buffer. With
+    ``copy=True`` the kernel is asked to prefetch the whole file, since
+    every sample is about to be copied out of it; with ``copy=False`` no
+    prefetch is requested and pages are only loaded as arrays touch them.
+
     Parameters
     ----------
     path : str or Path
-        Path to the .bin trace file.
+        Path to the .bin trace file (format version 1 or 2).
+    copy : bool
+        If True (default), every sample array owns its memory. If False,
+        sample arrays are read-only views into the mapped file, so parsing
+        copies nothing and pages are only read when an array is accessed.
+        The mapping stays open until the last view is released. Views into
+        version 1 files are strided.
 
     Returns
     -------
     TraceData
-        Dictionary of numpy arrays and metadata.
+        Numpy arrays and metadata.
+    """
+    return _read_trace(path, copy)
+
+
+def _read_trace(
+    path: str | Path, copy: bool = True, parallel: bool = True
+) -> TraceData:
+    """:func:`read_trace`, optionally without the parallel column copy.
+
+    :func:`read_traces` already reads files concurrently, so it passes
+    ``parallel=False`` to keep each file from starting its own pool.
+    """
+    with open(path, "rb") as f:
+        # mmap refuses empty files, so reject short files before mapping
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER_SIZE:
+            raise ValueError(f"File too small ({size} bytes)")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if not copy:
+        # The returned views reference ``mm``; it is unmapped once they
+        # are all garbage collected.
+        return _parse_trace(mm, copy=False)
+    _advise_full_read(mm)
+    try:
+        return _parse_trace(mm, parallel=parallel)
+    finally:
+        # Every returned array is a copy, so no views into the mapping
+        # outlive the parse.
+        mm.close()
+
+
+def read_traces(
+    paths: Iterable[str | Path],
+    copy: bool = True,
+    max_workers: int | None = None,
+) -> list[TraceData]:
+    """Read many trace files concurrently.
+
+    Each file is read with :func:`read_trace` on a thread pool. Page
+    faults and column copies run with the GIL released, so reads of
+    different files overlap and many small traces are not bound by one
+    synchronous read at a time. Parallelism is across files only: each
+    file's columns are copied on the thread reading it.
+
+    Parameters
+    ----------
+    paths : iterable of str or Path
+        Trace files to read.
+    copy : bool
+        Passed to :func:`read_trace`.
+    max_workers : int or None
+        Maximum number of files in flight (at least 1). Defaults to 64.
+
+    Returns
+    -------
+    list[TraceData]
+        One entry per path, in input order.
+    """
+    if max_workers is None:
+        max_workers = _MAX_INFLIGHT_READS
+    elif max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    paths = list(paths)
+    if not paths:
+        return []
+    workers = min(max_workers, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            lambda p: _read_trace(p, copy=copy, parallel=False), paths
+        ))
+
+
+def _parse_trace(
+    data: bytes | mmap.mmap, copy: bool = True, parallel: bool = True
+) -> TraceData:
+    """Parse a complete trace from an in-memory or mapped buffer.
+
+    See :func:`read_trace` for ``copy`` and :func:`_read_trace` for
+    ``parallel``.
     """
-    data = Path(path).read_bytes()
     if len(data) < _HEADER_SIZE:
         raise ValueError(f"File too small ({len(data)} bytes)")
 
     # ── Parse header ────────────────────────────────────────────────
-    magic, version = struct.unpack_from("<II", data, 0)
+    magic, version = _HDR_MAGIC.unpack_from(data, 0)
     if magic != _MAGIC:
         raise ValueError(f"Bad magic: 0x{magic:08X} (expected 0x{_MAGIC:08X})")
-    if version != _VERSION:
+    if version not in _SUPPORTED_VERSIONS:
         raise ValueError(f"Unsupported version: {version}")
 
     board_name = data[8:40].split(b"\x00", 1)[0].decode("utf-8")
-    (num_cpu, num_rails, num_zones, emc_avail) = struct.unpack_from(
-        "<BBBB", data, 40
+    (num_cpu, num_rails, num_zones, emc_avail) = _HDR_COUNTS.unpack_from(
+        data, 40
     )
-    (fast_hz, medium_hz, slow_hz) = struct.unpack_from("<III", data, 44)
-    (n_fast, n_med, n_slow, n_sync) = struct.unpack_from("<QQQQ", data, 56)
-
-    # Rail names: offset 88, 8 × 24 = 192 bytes
-    rail_names: list[str] = []
-    for i in range(num_rails):
-        off = 88 + i * 24
-        name = data[off : off + 24].split(b"\x00", 1)[0].decode("utf-8")
-        rail_names.append(name)
+    (fast_hz, medium_hz, slow_hz) = _HDR_HZ.unpack_from(data, 44)
+    (n_fast, n_med, n_slow, n_sync) = _HDR_NS.unpack_from(data, 56)
+
+    # Rail names: offset 88, 8 × 24 = 192 bytes. Decoded from a
+    # fixed-width "S24" view; ``tolist()`` hands back plain bytes so no
+    # view into ``data`` outlives this statement.
+    rail_names = [
+        s.split(b"\x00", 1)[0].decode("utf-8")
+        for s in np.frombuffer(
+            data, dtype="S24", count=num_rails, offset=88
+        ).tolist()
+    ]
 
     # Zone names: offset 88 + 192 = 280, 16 × 24 = 384 bytes
-    zone_names: list[str] = []
-    for i in range(num_zones):
-        off = 280 + i * 24
-        name = data[off : off + 24].split(b"\x00", 1)[0].decode("utf-8")
-        zone_names.append(name)
+    zone_names = [
+        s.split(b"\x00", 1)[0].decode("utf-8")
+        for s in np.frombuffer(
+            data, dtype="S24", count=num_zones, offset=280
+        ).tolist()
+    ]
 
     # ── Parse samples ───────────────────────────────────────────────
-    offset = _HEADER_SIZE
-
-    # Fast tier
-    fast_bytes = n_fast * _FAST_SAMPLE_SIZE
-    fast_dt = np.dtype(
-        [
-            ("time_s", "<f8"),
-            ("gpu_load", "<u2"),
-            ("cpu_util", "<f4", (_MAX_CPU_CORES,)),
-            ("cpu_aggregate", "<f4"),
-            ("ram_used_kb", "<u8"),
-            ("ram_available_kb", "<u8"),
-            ("emc_util", "<f4"),
-        ]
-    )
-    fast_arr = np.frombuffer(data, dtype=fast_dt, count=n_fast, offset=offset)
-    offset += fast_bytes
-
-    # Medium tier
-    med_bytes = n_med * _MEDIUM_SAMPLE_SIZE
-    med_dt = np.dtype(
-        [
-            ("time_s", "<f8"),
-            ("voltage_mv", "<u4", (_MAX_POWER_RAILS,)),
-            ("current_ma", "<u4", (_MAX_POWER_RAILS,)),
-            ("power_mw", "<f4", (_MAX_POWER_RAILS,)),
-        ]
-    )
-    med_arr = np.frombuffer(data, dtype=med_dt, count=n_med, offset=offset)
-    offset += med_bytes
-
-    # Slow tier
-    slow_bytes = n_slow * _SLOW_SAMPLE_SIZE
-    slow_dt = np.dtype(
-        [("time_s", "<f8"), ("temp_c", "<f4", (_MAX_THERMAL_ZONES,))]
-    )
-    slow_arr = np.frombuffer(data, dtype=slow_dt, count=n_slow, offset=offset)
-    offset += slow_bytes
-
-    # Sync points
-    sync_dt = np.dtype([("sync_id", "<u8"), ("fast_sample_idx", "<u8")])
-    sync_arr = np.frombuffer(data, dtype=sync_dt, count=n_sync, offset=offset)
-
-    # Forward-fill sync_id into per-fast-sample array
-    sync_ids = np.zeros(n_fast, dtype=np.uint64)
-    for sp in sync_arr:
-        idx = int(sp["fast_sample_idx"])
-        if idx < n_fast:
-            sync_ids[idx:] = sp["sync_id"]
+    counts = (n_fast, n_med, n_slow)
+    locate = _make_locator(version, num_cpu, num_rails, num_zones)
+    layout, sync_off = locate(counts)
+    end = sync_off + n_sync * _SYNC_POINT_SIZE
+    if len(data) < end:
+        raise ValueError(
+            f"File truncated ({len(data)} bytes, header expects {end})"
+        )
+
+    # Sync points, ordered by fast-sample index. Read as (n_sync, 2) plain
+    # u8 rows of (sync_id, fast_sample_idx) rather than a structured dtype.
+    if n_sync:
+        sync_arr = np.frombuffer(
+            data, dtype="<u8", count=2 * n_sync, offset=sync_off
+        ).reshape(n_sync, 2)
+        order = np.argsort(sync_arr[:, 1], kind="stable")
+        sync_idx = sync_arr[order, 1].astype(np.uint64)
+        sync_vals = sync_arr[order, 0].astype(np.uint64)
+        del sync_arr  # release the view so the mapping can be closed
+    else:
+        sync_idx = np.empty(0, dtype=np.uint64)
+        sync_vals = np.empty(0, dtype=np.uint64)
+
+    if not any(counts):
+        # Header-only trace: nothing to copy or dispatch
+        cols = {col.key: _column(data, col, copy) for col in layout}
+    elif copy:
+        cols = _copy_columns(data, layout, parallel)
+    else:
+        cols = {col.key: _column(data, col, copy=False) for col in layout}
 
     return TraceData(
         board_name=board_name,
@@ -203,22 +594,68 @@ def read_trace(path: str | Path) -> TraceData:
         slow_hz=slow_hz,
         power_rail_names=rail_names,
         thermal_zone_names=zone_names,
-        # Fast tier — trim CPU/power/thermal arrays to actual count
-        fast_time_s=fast_arr["time_s"].copy(),
-        gpu_load=fast_arr["gpu_load"].copy(),
-        cpu_util=fast_arr["cpu_util"][:, :num_cpu].copy(),
-        cpu_aggregate=fast_arr["cpu_aggregate"].copy(),
-        ram_used_kb=fast_arr["ram_used_kb"].copy(),
-        ram_available_kb=fast_arr["ram_available_kb"].copy(),
-        emc_util=fast_arr["emc_util"].copy(),
+        # Fast tier — CPU/power/thermal arrays trimmed to actual count
+        fast_time_s=cols["fast_time_s"],
+        gpu_load=cols["gpu_load"],
+        cpu_util=cols["cpu_util"],
+        cpu_aggregate=cols["cpu_aggregate"],
+        ram_used_kb=cols["ram_used_kb"],
+        ram_available_kb=cols["ram_available_kb"],
+        emc_util=cols["emc_util"],
         # Medium tier
-        medium_time_s=med_arr["time_s"].copy() if n_med else np.array([], dtype=np.float64),
-        voltage_mv=med_arr["voltage_mv"][:, :num_rails].copy() if n_med else np.empty((0, num_rails), dtype=np.uint32),
-        current_ma=med_arr["current_ma"][:, :num_rails].copy() if n_med else np.empty((0, num_rails), dtype=np.uint32),
-        power_mw=med_arr["power_mw"][:, :num_rails].copy() if n_med else np.empty((0, num_rails), dtype=np.float32),
+        medium_time_s=cols["medium_time_s"],
+        voltage_mv=cols["voltage_mv"],
+        current_ma=cols["current_ma"],
+        power_mw=cols["power_mw"],
         # Slow tier
-        slow_time_s=slow_arr["time_s"].copy() if n_slow else np.array([], dtype=np.float64),
-        temp_c=slow_arr["temp_c"][:, :num_zones].copy() if n_slow else np.empty((0, num_zones), dtype=np.float32),
+        slow_time_s=cols["slow_time_s"],
+        temp_c=cols["temp_c"],
         # Sync points
-        sync_id=sync_ids,
+        sync_points_idx=sync_idx,
+        sync_points_id=sync_vals,
+    )
+
+
+def sync_id_at(
+    trace: TraceData, fast_sample_idx: int | npt.ArrayLike
+) -> np.uint64 | npt.NDArray[np.uint64]:
+    """Look up the sync id in effect at the given fast-sample index(es).
+
+    Equivalent to ``trace.sync_id[fast_sample_idx]``, but computed from
+    the (few) sync points by binary search, so it never needs the dense
+    per-sample array.
+
+    Parameters
+    ----------
+    trace : TraceData
+        Result of :func:`read_trace`.
+    fast_sample_idx : int or array_like of int
+        Fast-sample index or indices. Negative indices count back from
+        the last fast sample, as in ``trace.sync_id[-1]``.
+
+    Returns
+    -------
+    numpy.uint64 or numpy.ndarray
+        Sync id(s), 0 before the first sync point: a scalar for scalar
+        input, otherwise a ``uint64`` array of the input's shape.
+
+    Raises
+    ------
+    IndexError
+        If an index is not below the number of fast samples, or a
+        negative index reaches before the first one.
+    """
+    idx = np.asarray(fast_sample_idx, dtype=np.int64)
+    n_fast = len(trace.fast_time_s)
+    idx = np.where(idx < 0, idx + n_fast, idx)
+    if np.any((idx < 0) | (idx >= n_fast)):
+        raise IndexError(
+            f"fast-sample index out of range for {n_fast} samples"
+        )
+    pos = np.searchsorted(
+        trace.sync_points_idx, idx.astype(np.uint64), side="right"
+    )
+    ids = np.concatenate(
+        (np.zeros(1, dtype=np.uint64), trace.sync_points_id)
     )
+    return ids[pos]
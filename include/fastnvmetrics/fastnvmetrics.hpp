@@ -13,7 +13,7 @@ namespace fastnvmetrics {
 // ── Constants ──────────────────────────────────────────────────────
 
 constexpr uint32_t MAGIC   = 0x4E564D54u; // "NVMT" (NVMetrics Trace)
-constexpr uint32_t VERSION = 1;
+constexpr uint32_t VERSION = 2;
 
 constexpr int MAX_CPU_CORES     = 16;
 constexpr int MAX_POWER_RAILS   = 8;
@@ -21,12 +21,30 @@ constexpr int MAX_THERMAL_ZONES = 16;
 
 // ── Binary format (packed structs) ─────────────────────────────────
 //
-// File layout:
+// Version 2 file layout (columnar):
 //   [FileHeader]
-//   [FastSample   × num_fast_samples]
-//   [MediumSample × num_medium_samples]
-//   [SlowSample   × num_slow_samples]
-//   [SyncPoint    × num_sync_points]
+//   [fast columns]   time_s, gpu_load, cpu_util, cpu_aggregate,
+//                    ram_used_kb, ram_available_kb, emc_util
+//   [medium columns] time_s, voltage_mv, current_ma, power_mw
+//   [slow columns]   time_s, temp_c
+//   [SyncPoint × num_sync_points]
+//
+// Each column holds one sample field for every sample of its tier,
+// back-to-back. Array fields are trimmed to the active count (e.g.
+// cpu_util is num_fast_samples × num_cpu_cores floats, row-major).
+// Every column is zero-padded to a multiple of COLUMN_ALIGN bytes, so
+// column offsets follow from the header counts alone (see column_size).
+//
+// Version 1 files (still readable from Python) store the sample
+// structs below back-to-back instead of the columns.
+
+constexpr uint64_t COLUMN_ALIGN = 8;
+
+/// On-disk size of a version 2 column of `count` elements of
+/// `elem_size` bytes, including padding.
+constexpr uint64_t column_size(uint64_t count, uint64_t elem_size) {
+    return (count * elem_size + COLUMN_ALIGN - 1) / COLUMN_ALIGN * COLUMN_ALIGN;
+}
 
 #pragma pack(push, 1)
 
@@ -93,6 +111,9 @@ struct SyncPoint {
 
 #pragma pack(pop)
 
+/// Byte offset of the SyncPoint table in a version 2 file.
+uint64_t sync_points_offset(const FileHeader &hdr);
+
 // ── Board configuration ────────────────────────────────────────────
 
 struct PowerRailConfig {
@@ -2,6 +2,7 @@
 
 #include <algorithm>
 #include <cerrno>
+#include <cstddef>
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
@@ -470,6 +471,61 @@ void Engine::close_fds() {
     fd_thermal_.clear();
 }
 
+// ── File output ────────────────────────────────────────────────────
+
+/// Bytes of sample fields write_column gathers before each fwrite.
+static constexpr size_t WRITE_STAGE_BYTES = 64 * 1024;
+
+/// Write one field of every sample as a contiguous column (bytes
+/// [field_offset, field_offset + field_bytes) of each sample), then
+/// zero-pad to COLUMN_ALIGN. Fields are gathered through a bounded
+/// staging buffer, so writing a column never holds a second copy of it.
+template <typename Sample>
+static void write_column(FILE *fp, const std::vector<Sample> &samples,
+                         size_t field_offset, size_t field_bytes) {
+    if (samples.empty() || field_bytes == 0) return;
+
+    const size_t per_flush =
+        std::min(std::max<size_t>(WRITE_STAGE_BYTES / field_bytes, 1),
+                 samples.size());
+    std::vector<unsigned char> stage(per_flush * field_bytes);
+    const auto *src = reinterpret_cast<const unsigned char *>(samples.data());
+    for (size_t i = 0; i < samples.size(); i += per_flush) {
+        const size_t n = std::min(per_flush, samples.size() - i);
+        for (size_t j = 0; j < n; ++j)
+            std::memcpy(stage.data() + j * field_bytes,
+                        src + (i + j) * sizeof(Sample) + field_offset,
+                        field_bytes);
+        fwrite(stage.data(), field_bytes, n, fp);
+    }
+
+    static const unsigned char zeros[COLUMN_ALIGN] = {};
+    const size_t nbytes = samples.size() * field_bytes;
+    fwrite(zeros, 1, column_size(samples.size(), field_bytes) - nbytes, fp);
+}
+
+uint64_t sync_points_offset(const FileHeader &hdr) {
+    const uint64_t nf = hdr.num_fast_samples;
+    const uint64_t nm = hdr.num_medium_samples;
+    const uint64_t ns = hdr.num_slow_samples;
+    const uint64_t nr = hdr.num_power_rails;
+    return sizeof(FileHeader) +
+           // Fast tier
+           column_size(nf, sizeof(double)) +
+           column_size(nf, sizeof(uint16_t)) +
+           column_size(nf * hdr.num_cpu_cores, sizeof(float)) +
+           column_size(nf, sizeof(float)) +
+           column_size(nf, sizeof(uint64_t)) * 2 +
+           column_size(nf, sizeof(float)) +
+           // Medium tier
+           column_size(nm, sizeof(double)) +
+           column_size(nm * nr, sizeof(uint32_t)) * 2 +
+           column_size(nm * nr, sizeof(float)) +
+           // Slow tier
+           column_size(ns, sizeof(double)) +
+           column_size(ns * hdr.num_thermal_zones, sizeof(float));
+}
+
 void Engine::write_file() {
     FILE *fp = fopen(output_path_.c_str(), "wb");
     if (!fp) throw std::runtime_error("Cannot open " + output_path_);
@@ -500,11 +556,32 @@ void Engine::write_file() {
         std::strncpy(hdr.thermal_zone_names[i],
                      board_.thermal_zones[i].name.c_str(), 23);
 
+    const size_t ncpu   = hdr.num_cpu_cores;
+    const size_t nrails = hdr.num_power_rails;
+    const size_t nzones = hdr.num_thermal_zones;
+
     fwrite(&hdr, sizeof(hdr), 1, fp);
-    fwrite(fast_samples_.data(),   sizeof(FastSample),   fast_samples_.size(),   fp);
-    fwrite(medium_samples_.data(), sizeof(MediumSample), medium_samples_.size(), fp);
-    fwrite(slow_samples_.data(),   sizeof(SlowSample),   slow_samples_.size(),   fp);
-    fwrite(sync_points_.data(),    sizeof(SyncPoint),    sync_points_.size(),    fp);
+
+    // Fast tier columns
+    write_column(fp, fast_samples_, offsetof(FastSample, time_s), sizeof(double));
+    write_column(fp, fast_samples_, offsetof(FastSample, gpu_load), sizeof(uint16_t));
+    write_column(fp, fast_samples_, offsetof(FastSample, cpu_util), ncpu * sizeof(float));
+    write_column(fp, fast_samples_, offsetof(FastSample, cpu_aggregate), sizeof(float));
+    write_column(fp, fast_samples_, offsetof(FastSample, ram_used_kb), sizeof(uint64_t));
+    write_column(fp, fast_samples_, offsetof(FastSample, ram_available_kb), sizeof(uint64_t));
+    write_column(fp, fast_samples_, offsetof(FastSample, emc_util), sizeof(float));
+
+    // Medium tier columns
+    write_column(fp, medium_samples_, offsetof(MediumSample, time_s), sizeof(double));
+    write_column(fp, medium_samples_, offsetof(MediumSample, voltage_mv), nrails * sizeof(uint32_t));
+    write_column(fp, medium_samples_, offsetof(MediumSample, current_ma), nrails * sizeof(uint32_t));
+    write_column(fp, medium_samples_, offsetof(MediumSample, power_mw), nrails * sizeof(float));
+
+    // Slow tier columns
+    write_column(fp, slow_samples_, offsetof(SlowSample, time_s), sizeof(double));
+    write_column(fp, slow_samples_, offsetof(SlowSample, temp_c), nzones * sizeof(float));
+
+    fwrite(sync_points_.data(), sizeof(SyncPoint), sync_points_.size(), fp);
 
     fclose(fp);
 }
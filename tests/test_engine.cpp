@@ -50,6 +50,14 @@ TEST(StructLayout, SlowSample) { EXPECT_EQ(sizeof(SlowSample), 72); }
 
 TEST(StructLayout, SyncPoint) { EXPECT_EQ(sizeof(SyncPoint), 16); }
 
+TEST(StructLayout, ColumnSizePadsToAlignment) {
+    EXPECT_EQ(column_size(0, sizeof(uint16_t)), 0);
+    EXPECT_EQ(column_size(3, sizeof(uint16_t)), 8);   // 6 -> 8
+    EXPECT_EQ(column_size(4, sizeof(uint16_t)), 8);
+    EXPECT_EQ(column_size(5, sizeof(float)), 24);     // 20 -> 24
+    EXPECT_EQ(column_size(7, sizeof(double)), 56);
+}
+
 // ── FileHeader field offset/content tests ─────────────────────────
 
 TEST(StructLayout, FileHeaderFieldOffsets) {
@@ -364,11 +372,7 @@ TEST(TraceFile, SyncPointsInFile) {
     EXPECT_EQ(hdr.num_sync_points, 3);
 
     // Seek to sync point section
-    auto sync_offset = sizeof(FileHeader) +
-                       hdr.num_fast_samples * sizeof(FastSample) +
-                       hdr.num_medium_samples * sizeof(MediumSample) +
-                       hdr.num_slow_samples * sizeof(SlowSample);
-    f.seekg(sync_offset);
+    f.seekg(sync_points_offset(hdr));
 
     SyncPoint sp[3];
     f.read(reinterpret_cast<char *>(sp), 3 * sizeof(SyncPoint));
@@ -405,10 +409,7 @@ TEST(TraceFile, FileSize) {
     f.read(reinterpret_cast<char *>(&hdr), sizeof(hdr));
 
     // Expected file size
-    auto expected = sizeof(FileHeader) +
-                    hdr.num_fast_samples * sizeof(FastSample) +
-                    hdr.num_medium_samples * sizeof(MediumSample) +
-                    hdr.num_slow_samples * sizeof(SlowSample) +
+    auto expected = sync_points_offset(hdr) +
                     hdr.num_sync_points * sizeof(SyncPoint);
 
     EXPECT_EQ(static_cast<size_t>(file_size), expected);
@@ -432,15 +433,16 @@ TEST(TraceFile, FastSampleTimestampsMonotonic) {
     FileHeader hdr{};
     f.read(reinterpret_cast<char *>(&hdr), sizeof(hdr));
 
+    // Fast time_s is the first column, directly after the header
     double prev_time = -1.0;
     for (uint64_t i = 0; i < hdr.num_fast_samples; ++i) {
-        FastSample s{};
-        f.read(reinterpret_cast<char *>(&s), sizeof(s));
+        double time_s = 0.0;
+        f.read(reinterpret_cast<char *>(&time_s), sizeof(time_s));
         ASSERT_TRUE(f.good()) << "Failed to read fast sample " << i;
-        EXPECT_GT(s.time_s, prev_time)
+        EXPECT_GT(time_s, prev_time)
             << "Non-monotonic at sample " << i
-            << " (" << s.time_s << " <= " << prev_time << ")";
-        prev_time = s.time_s;
+            << " (" << time_s << " <= " << prev_time << ")";
+        prev_time = time_s;
     }
 }
 
@@ -489,22 +491,31 @@ TEST(TraceFile, EmcUtilRange) {
     ASSERT_TRUE(f.good());
     ASSERT_GT(hdr.num_fast_samples, 50);
 
+    // emc_util is the last fast-tier column
+    const uint64_t n = hdr.num_fast_samples;
+    f.seekg(sizeof(FileHeader) +
+            column_size(n, sizeof(double)) +
+            column_size(n, sizeof(uint16_t)) +
+            column_size(n * hdr.num_cpu_cores, sizeof(float)) +
+            column_size(n, sizeof(float)) +
+            column_size(n, sizeof(uint64_t)) * 2);
+
     int n_negative = 0;
     int n_saturated = 0;
-    for (uint64_t i = 0; i < hdr.num_fast_samples; ++i) {
-        FastSample s{};
-        f.read(reinterpret_cast<char *>(&s), sizeof(s));
+    for (uint64_t i = 0; i < n; ++i) {
+        float emc_util = 0.0f;
+        f.read(reinterpret_cast<char *>(&emc_util), sizeof(emc_util));
         ASSERT_TRUE(f.good()) << "Failed to read sample " << i;
 
         // Every sample must be in [0, 100], never -1 (N/A sentinel)
-        EXPECT_GE(s.emc_util, 0.0f)
-            << "Sample " << i << ": emc_util = " << s.emc_util
+        EXPECT_GE(emc_util, 0.0f)
+            << "Sample " << i << ": emc_util = " << emc_util
             << " (lseek on debugfs likely failed with ESPIPE)";
-        EXPECT_LE(s.emc_util, 100.0f)
-            << "Sample " << i << ": emc_util = " << s.emc_util;
+        EXPECT_LE(emc_util, 100.0f)
+            << "Sample " << i << ": emc_util = " << emc_util;
 
-        if (s.emc_util < 0.0f) ++n_negative;
-        if (s.emc_util >= 99.0f) ++n_saturated;
+        if (emc_util < 0.0f) ++n_negative;
+        if (emc_util >= 99.0f) ++n_saturated;
     }
 
     // No samples should be the -1.0 sentinel
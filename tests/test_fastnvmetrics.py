@@ -4,17 +4,21 @@ from __future__ import annotations
 
 import struct
 import tempfile
+import threading
 import time
 from pathlib import Path
 
 import numpy as np
 import pytest
 
+import fastnvmetrics
 from fastnvmetrics import (
     NVMetrics,
     detect_board,
     get_board_config,
     read_trace,
+    read_traces,
+    sync_id_at,
 )
 
 # ── Fixtures ────────────────────────────────────────────────────────
@@ -56,6 +60,90 @@ def emc_trace(tmp_path: Path, emc_available: bool) -> Path:
     return p
 
 
+def _write_synthetic_trace(path: Path, version: int, n_fast: int = 50) -> dict:
+    """Write a small trace of known values in format ``version``.
+
+    Returns the expected arrays, keyed like ``TraceData``. Sync points
+    are written out of index order, at fast samples 10 and 40, so
+    ``n_fast`` must be above 40.
+    """
+    n_med, n_slow = 5, 2
+    num_cpu, num_rails, num_zones = 3, 2, 4
+
+    hdr = bytearray(728)
+    struct.pack_into("<II", hdr, 0, 0x4E564D54, version)
+    hdr[8:16] = b"agx_orin"
+    struct.pack_into("<BBBB", hdr, 40, num_cpu, num_rails, num_zones, 1)
+    struct.pack_into("<III", hdr, 44, 1000, 100, 10)
+    struct.pack_into("<QQQQ", hdr, 56, n_fast, n_med, n_slow, 2)
+    for i in range(num_rails):
+        struct.pack_into("24s", hdr, 88 + 24 * i, f"RAIL_{i}".encode())
+    for i in range(num_zones):
+        struct.pack_into("24s", hdr, 280 + 24 * i, f"zone{i}".encode())
+
+    fast = np.zeros(n_fast, dtype=[
+        ("time_s", "<f8"), ("gpu_load", "<u2"), ("cpu_util", "<f4", 16),
+        ("cpu_aggregate", "<f4"), ("ram_used_kb", "<u8"),
+        ("ram_available_kb", "<u8"), ("emc_util", "<f4"),
+    ])
+    fast["time_s"] = np.arange(n_fast) * 1e-3
+    fast["gpu_load"] = np.arange(n_fast) * 7
+    fast["cpu_util"] = np.arange(n_fast * 16).reshape(n_fast, 16)
+    fast["cpu_aggregate"] = np.arange(n_fast) + 0.5
+    fast["ram_used_kb"] = np.arange(n_fast) + 1000
+    fast["ram_available_kb"] = np.arange(n_fast) + 2000
+    fast["emc_util"] = np.arange(n_fast) * 0.25
+
+    med = np.zeros(n_med, dtype=[
+        ("time_s", "<f8"), ("voltage_mv", "<u4", 8),
+        ("current_ma", "<u4", 8), ("power_mw", "<f4", 8),
+    ])
+    med["time_s"] = np.arange(n_med) * 1e-2
+    med["voltage_mv"] = np.arange(n_med * 8).reshape(n_med, 8) + 5000
+    med["current_ma"] = np.arange(n_med * 8).reshape(n_med, 8) + 100
+    med["power_mw"] = np.arange(n_med * 8).reshape(n_med, 8) * 1.5
+
+    slow = np.zeros(n_slow, dtype=[("time_s", "<f8"), ("temp_c", "<f4", 16)])
+    slow["time_s"] = np.arange(n_slow) * 0.1
+    slow["temp_c"] = np.arange(n_slow * 16).reshape(n_slow, 16) + 30.0
+
+    # (sync_id, fast_sample_idx), deliberately unsorted
+    sync = np.array([[2, 40], [1, 10]], dtype="<u8")
+
+    expected = {
+        "fast_time_s": fast["time_s"],
+        "gpu_load": fast["gpu_load"],
+        "cpu_util": fast["cpu_util"][:, :num_cpu],
+        "cpu_aggregate": fast["cpu_aggregate"],
+        "ram_used_kb": fast["ram_used_kb"],
+        "ram_available_kb": fast["ram_available_kb"],
+        "emc_util": fast["emc_util"],
+        "medium_time_s": med["time_s"],
+        "voltage_mv": med["voltage_mv"][:, :num_rails],
+        "current_ma": med["current_ma"][:, :num_rails],
+        "power_mw": med["power_mw"][:, :num_rails],
+        "slow_time_s": slow["time_s"],
+        "temp_c": slow["temp_c"][:, :num_zones],
+    }
+
+    if version == 1:
+        body = fast.tobytes() + med.tobytes() + slow.tobytes()
+    else:
+        body = b""
+        for arr in expected.values():
+            col = np.ascontiguousarray(arr).tobytes()
+            body += col + bytes(-len(col) % 8)
+    path.write_bytes(bytes(hdr) + body + sync.tobytes())
+
+    sync_id = np.zeros(n_fast, dtype=np.uint64)
+    sync_id[10:] = 1
+    sync_id[40:] = 2
+    expected["sync_points_idx"] = np.array([10, 40], dtype=np.uint64)
+    expected["sync_points_id"] = np.array([1, 2], dtype=np.uint64)
+    expected["sync_id"] = sync_id
+    return expected
+
+
 # ── Board config tests ──────────────────────────────────────────────
 
 
@@ -183,6 +271,81 @@ class TestReadTrace:
         assert data["sync_id"].dtype == np.uint64
         assert len(data["sync_id"]) == len(data["fast_time_s"])
 
+    def test_attribute_and_item_access(self, short_trace: Path) -> None:
+        data = read_trace(short_trace)
+        assert data.board_name == data["board_name"]
+        assert data.gpu_load is data["gpu_load"]
+        with pytest.raises(KeyError):
+            data["not_a_field"]
+        with pytest.raises(KeyError):
+            data[0]
+
+    def test_dict_style_access(self, short_trace: Path) -> None:
+        data = read_trace(short_trace)
+        assert "gpu_load" in data
+        assert "sync_id" in data
+        assert "not_a_field" not in data
+        assert 0 not in data
+        assert data.get("gpu_load") is data.gpu_load
+        assert data.get("not_a_field") is None
+        assert data.get("not_a_field", 1) == 1
+        as_dict = dict(data)
+        assert list(as_dict) == list(data.keys())
+        assert len(data) == len(as_dict)
+        assert [k for k, _ in data.items()] == list(data.keys())
+        assert all(v is data[k] for k, v in data.items())
+        assert len(data.values()) == len(data)
+        assert as_dict["board_name"] == data.board_name
+        assert "_sync_id" not in as_dict
+        assert as_dict["sync_id"] is data.sync_id
+
+    def test_zero_copy_matches_copy(self, short_trace: Path) -> None:
+        """copy=False should return read-only views with identical data."""
+        copied = read_trace(short_trace)
+        views = read_trace(short_trace, copy=False)
+        for key in ("fast_time_s", "cpu_util", "power_mw", "temp_c"):
+            np.testing.assert_array_equal(views[key], copied[key])
+            assert not views[key].flags.writeable, key
+        np.testing.assert_array_equal(views["sync_id"], copied["sync_id"])
+
+    def test_read_traces_matches_read_trace(self, short_trace: Path) -> None:
+        """Batch reads should match single reads, in input order."""
+        single = read_trace(short_trace)
+        batch = read_traces([short_trace, str(short_trace)])
+        assert len(batch) == 2
+        for data in batch:
+            assert data["board_name"] == single["board_name"]
+            np.testing.assert_array_equal(data["cpu_util"], single["cpu_util"])
+            np.testing.assert_array_equal(data["sync_id"], single["sync_id"])
+        assert read_traces([]) == []
+
+    def test_read_traces_mixed_versions(self, tmp_path: Path) -> None:
+        """A zero-copy batch of v1 and v2 files should keep input order."""
+        paths = [tmp_path / f"trace{i}.bin" for i in range(4)]
+        versions, lengths = (1, 2, 2, 1), (50, 60, 70, 80)
+        expected = [
+            _write_synthetic_trace(p, version, n_fast)
+            for p, version, n_fast in zip(paths, versions, lengths)
+        ]
+        batch = read_traces(paths, copy=False, max_workers=2)
+        assert len(batch) == len(paths)
+        for data, want in zip(batch, expected):
+            for key, arr in want.items():
+                np.testing.assert_array_equal(data[key], arr, err_msg=key)
+            assert not data.cpu_util.flags.writeable
+
+    def test_read_traces_propagates_errors(self, tmp_path: Path) -> None:
+        good = tmp_path / "good.bin"
+        bad = tmp_path / "bad.bin"
+        _write_synthetic_trace(good, 2)
+        bad.write_bytes(b"\x00" * 728)
+        with pytest.raises(ValueError, match="Bad magic"):
+            read_traces([good, bad, good])
+
+    def test_read_traces_rejects_zero_workers(self) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            read_traces([], max_workers=0)
+
     def test_bad_magic_raises(self) -> None:
         with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
             f.write(b"\x00" * 728)
@@ -214,6 +377,80 @@ class TestReadTrace:
             read_trace(path)
         Path(path).unlink()
 
+    def test_truncated_file_raises(self) -> None:
+        """Header claiming more samples than the file holds should raise."""
+        hdr = bytearray(728)
+        struct.pack_into("<II", hdr, 0, 0x4E564D54, 1)
+        # num_fast_samples = 10, but no sample bytes follow the header
+        struct.pack_into("<Q", hdr, 56, 10)
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            f.write(bytes(hdr))
+            path = f.name
+        with pytest.raises(ValueError, match="truncated"):
+            read_trace(path)
+        Path(path).unlink()
+
+
+# ── Format version tests ────────────────────────────────────────────
+
+
+class TestFormatVersions:
+    @pytest.mark.parametrize("version", [1, 2])
+    @pytest.mark.parametrize("copy", [True, False])
+    def test_synthetic_trace_values(
+        self, tmp_bin: Path, version: int, copy: bool
+    ) -> None:
+        """Both on-disk layouts should decode to the same known values."""
+        expected = _write_synthetic_trace(tmp_bin, version)
+        data = read_trace(tmp_bin, copy=copy)
+        assert data.board_name == "agx_orin"
+        assert data.power_rail_names == ["RAIL_0", "RAIL_1"]
+        assert data.thermal_zone_names == ["zone0", "zone1", "zone2", "zone3"]
+        for key, want in expected.items():
+            np.testing.assert_array_equal(data[key], want, err_msg=key)
+            assert data[key].dtype == want.dtype, key
+        np.testing.assert_array_equal(
+            sync_id_at(data, np.arange(50)), expected["sync_id"]
+        )
+
+    @pytest.mark.parametrize("version", [1, 2])
+    def test_large_columns_64_byte_aligned(
+        self, tmp_bin: Path, version: int
+    ) -> None:
+        """Copied columns of 4 KiB or more should be 64-byte aligned."""
+        expected = _write_synthetic_trace(tmp_bin, version, n_fast=1024)
+        data = read_trace(tmp_bin)
+        assert data.cpu_util.nbytes >= 4096
+        assert data.gpu_load.nbytes < 4096
+        for key, want in expected.items():
+            np.testing.assert_array_equal(data[key], want, err_msg=key)
+            # sync_* arrays are built, not copied, so are not aligned
+            if data[key].nbytes >= 4096 and not key.startswith("sync_"):
+                assert data[key].ctypes.data % 64 == 0, key
+
+    @pytest.mark.parametrize("version", [1, 2])
+    def test_parallel_copy_matches_expected(
+        self, tmp_bin: Path, version: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Columns copied on the thread pool should match the known values."""
+        expected = _write_synthetic_trace(tmp_bin, version)
+        monkeypatch.setattr(fastnvmetrics, "_PARALLEL_COPY_BYTES", 0)
+        monkeypatch.setattr(fastnvmetrics, "_copy_workers", lambda: 4)
+        threads = set()
+        column = fastnvmetrics._column
+
+        def tracking_column(*args, **kwargs):
+            threads.add(threading.get_ident())
+            return column(*args, **kwargs)
+
+        monkeypatch.setattr(fastnvmetrics, "_column", tracking_column)
+        data = read_trace(tmp_bin)
+        assert threads and threading.get_ident() not in threads
+        for key, want in expected.items():
+            np.testing.assert_array_equal(data[key], want, err_msg=key)
+            assert data[key].dtype == want.dtype, key
+
 
 # ── Multi-rate reconstruction tests ─────────────────────────────────
 
@@ -251,6 +488,23 @@ class TestMultiRate:
 
         assert data["temp_c"].shape == (n_slow, n_zones)
 
+    def test_array_columns_trimmed_and_contiguous(
+        self, short_trace: Path
+    ) -> None:
+        """Per-core/rail/zone arrays should be dense, trimmed copies."""
+        data = read_trace(short_trace)
+        for key, width in (
+            ("cpu_util", data["num_cpu_cores"]),
+            ("voltage_mv", data["num_power_rails"]),
+            ("power_mw", data["num_power_rails"]),
+            ("temp_c", data["num_thermal_zones"]),
+        ):
+            arr = data[key]
+            assert arr.shape[1] == width, key
+            assert arr.flags.c_contiguous, key
+            # Views into the read-only mapping would not be writeable
+            assert arr.flags.writeable, f"{key} is a view, not a copy"
+
 
 # ── Timing tests ────────────────────────────────────────────────────
 
@@ -346,7 +600,37 @@ class TestDataRanges:
 class TestSyncForwardFill:
     def test_sync_id_matches_fast_length(self, short_trace: Path) -> None:
         data = read_trace(short_trace)
-        assert len(data["sync_id"]) == len(data["fast_time_s"])
+        n_fast = len(data["fast_time_s"])
+        assert len(data["sync_id"]) == n_fast
+        # The sync-point accessor must agree with the dense array
+        looked_up = sync_id_at(data, np.arange(n_fast))
+        np.testing.assert_array_equal(looked_up, data["sync_id"])
+
+    def test_sync_id_built_once(self, short_trace: Path) -> None:
+        data = read_trace(short_trace)
+        assert data.sync_id is data.sync_id
+        assert data["sync_id"] is data.sync_id
+
+    def test_sync_id_at_index_bounds(self, tmp_bin: Path) -> None:
+        """Indices should wrap and bounds-check like ``sync_id[...]``."""
+        _write_synthetic_trace(tmp_bin, 2)
+        data = read_trace(tmp_bin)
+        assert sync_id_at(data, -1) == data.sync_id[-1]
+        np.testing.assert_array_equal(
+            sync_id_at(data, [-50, -41, -10]), data.sync_id[[-50, -41, -10]]
+        )
+        with pytest.raises(IndexError):
+            sync_id_at(data, -51)
+        assert sync_id_at(data, 49) == data.sync_id[49]
+        with pytest.raises(IndexError):
+            sync_id_at(data, 50)
+        with pytest.raises(IndexError):
+            sync_id_at(data, [0, 10**6])
+
+    def test_sync_points_sorted(self, short_trace: Path) -> None:
+        data = read_trace(short_trace)
+        assert data["sync_points_id"].tolist() == [1, 2, 3]
+        assert np.all(np.diff(data["sync_points_idx"].astype(np.int64)) >= 0)
 
     def test_sync_id_starts_at_zero_before_first_sync(
         self, short_trace: Path
@@ -422,6 +706,29 @@ class TestEdgeCases:
         assert len(data["fast_time_s"]) >= 10
         assert data["board_name"]
 
+    def test_header_only_trace(self) -> None:
+        """A trace with no samples should parse to empty, shaped arrays."""
+        hdr = bytearray(728)
+        struct.pack_into("<II", hdr, 0, 0x4E564D54, 2)
+        struct.pack_into("<BBBB", hdr, 40, 4, 2, 3, 0)
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            f.write(bytes(hdr))
+            path = f.name
+        data = read_trace(path)
+        views = read_trace(path, copy=False)
+        Path(path).unlink()
+        assert data["fast_time_s"].shape == (0,)
+        assert data["cpu_util"].shape == (0, 4)
+        assert data["power_mw"].shape == (0, 2)
+        assert data["temp_c"].shape == (0, 3)
+        assert data["sync_id"].shape == (0,)
+        assert len(data["sync_points_idx"]) == 0
+        assert data["cpu_util"].flags.writeable
+        assert views["cpu_util"].shape == (0, 4)
+        assert not views["cpu_util"].flags.writeable
+        assert not views["temp_c"].flags.writeable
+
     def test_no_sync_points(self, tmp_bin: Path) -> None:
         """Trace without sync points should have all-zero sync_id."""
         with NVMetrics(str(tmp_bin)):